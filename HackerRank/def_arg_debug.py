@@ -1,32 +1,54 @@
-class EvenStream(object):
-    def __init__(self):
-        self.current = 0
+import sys
 
-    def get_next(self):
-        to_return = self.current
-        self.current += 2
-        return to_return
+class NumberStream(object):
+    __slots__ = ("current",)
+    start = 0
+    step = 2
 
-class OddStream(object):
     def __init__(self):
-        self.current = 1
+        self.current = self.start
 
     def get_next(self):
         to_return = self.current
-        self.current += 2
+        self.current += self.step
         return to_return
 
+    def take(self, n):
+        # next n values as a range, O(1) regardless of n
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        res = range(self.current, self.current + n * self.step, self.step)
+        self.current += n * self.step
+        return res
+
+class EvenStream(NumberStream):
+    __slots__ = ()
+    start = 0
+
+class OddStream(NumberStream):
+    __slots__ = ()
+    start = 1
+
 # to debug
-def print_from_stream(n, stream=EvenStream()):
-    for _ in range(n):
-        print(stream.get_next())
-
-
-queries = int(input())
-for _ in range(queries):
-    stream_name, n = input().split()
-    n = int(n)
-    if stream_name == "even":
-        print_from_stream(n)
-    else:
-        print_from_stream(n, OddStream())
+def print_from_stream(n, stream=None, out=None):
+    # a default of EvenStream() would be shared between calls
+    if stream is None:
+        stream = EvenStream()
+    out = out or sys.stdout
+    values = stream.take(n)
+    # join in slices of the range so a huge n never builds one giant string
+    for i in range(0, len(values), 1 << 16):
+        out.write("\n".join(map(str, values[i:i + (1 << 16)])) + "\n")
+
+
+if __name__ == "__main__":
+    out = open(sys.stdout.fileno(), "w", buffering=1 << 20, closefd=False)
+    queries = int(sys.stdin.readline())
+    for _ in range(queries):
+        stream_name, n = sys.stdin.readline().split()
+        n = int(n)
+        if stream_name == "even":
+            print_from_stream(n, out=out)
+        else:
+            print_from_stream(n, OddStream(), out)
+    out.flush()
@@ -2,21 +2,18 @@
 # Input: ["neet", "code", "love", "you"]
 # Output: ["neet", "code", "love", "you"]
 
+import struct
+
 class Solution:
 
     def encode(self, strs: list[str])->str:
-        res = ""
-        for s in strs:
-            res+=str(len(s)) + "#" + s
-        return res
+        return "".join(f"{len(s)}#{s}" for s in strs)
 
     def decode(self, s:str)->list[str]:
         res = []
         i=0
         while i<len(s):
-            j=i
-            while s[j]!="#":
-                j+=1
+            j = s.index("#", i)
             length = int(s[i:j])
             i=j+1
             j=i+length
@@ -25,6 +22,149 @@ class Solution:
         
         return res
 
+
+# Binary length-prefixed framing
+# Each frame is <length><payload>, where length is either a fixed-width
+# 4 byte big-endian unsigned int or an unsigned LEB128 varint
+
+_FIXED = struct.Struct(">I")
+
+def _encode_varint(n:int)->bytes:
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+def _decode_varint(buf, pos:int, end:int)->tuple[int, int]:
+    """
+    Decode a varint starting at pos
+
+    Returns:
+        (value, position after the varint), or (-1, pos) if buf ends
+        before the varint is complete
+    """
+    result = 0
+    shift = 0
+    while pos < end:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+    return -1, pos
+
+def encode_frames(items:list[bytes], varint:bool=False)->bytes:
+    """
+    Function to encode byte strings into a single length-prefixed buffer
+
+    Args:
+        items: list of bytes-like objects
+        varint: use varint length prefixes instead of fixed 4 byte ones
+
+    Returns:
+        Encoded buffer, built with a single join
+    """
+    pack = _encode_varint if varint else _FIXED.pack
+    parts = []
+    for item in items:
+        parts.append(pack(len(item)))
+        parts.append(item)
+    return b"".join(parts)
+
+def decode_frames(data, varint:bool=False)->list[memoryview]:
+    """
+    Function to decode a buffer produced by encode_frames
+
+    Args:
+        data: bytes-like object holding complete frames
+        varint: whether the frames use varint length prefixes
+
+    Returns:
+        list of memoryview slices into data (no payload is copied)
+    """
+    view = memoryview(data).cast("B")
+    decoder = FrameDecoder(varint)
+    frames = list(decoder._frames(view, 0, len(view)))
+    if decoder._pos != len(view):
+        raise ValueError("Truncated frame at end of buffer")
+    return frames
+
+class FrameDecoder:
+    """
+    Incremental decoder for length-prefixed frames, chunks may be split
+    at arbitrary boundaries (eg. reads from a socket or file)
+
+    Frames that lie inside a single fed chunk are returned as memoryview
+    slices of that chunk; frames spanning chunks are reassembled once.
+    The returned memoryviews alias the fed chunk, so a buffer that is
+    reused (eg. with recv_into/readinto) must be copied before feeding.
+    """
+
+    def __init__(self, varint:bool=False):
+        self.varint = varint
+        self._buf = bytearray()
+        self._need = -1                                         # bytes needed to complete the buffered frame, -1 if unknown
+        self._pos = 0
+
+    def _update_need(self):
+        length, start = self._read_length(self._buf, 0, len(self._buf))
+        self._need = start + length if length >= 0 else -1
+
+    def _read_length(self, view, pos:int, end:int)->tuple[int, int]:
+        if self.varint:
+            return _decode_varint(view, pos, end)
+        if end - pos < 4:
+            return -1, pos
+        return _FIXED.unpack_from(view, pos)[0], pos + 4
+
+    def _frames(self, view, pos:int, end:int):
+        self._pos = pos
+        while pos < end:
+            length, start = self._read_length(view, pos, end)
+            if length < 0 or start + length > end:
+                break
+            pos = start + length
+            self._pos = pos
+            yield view[start:pos]
+
+    def feed(self, chunk)->list[memoryview]:
+        """
+        Feed the next chunk of data
+
+        Args:
+            chunk: bytes-like object
+
+        Returns:
+            list of frames completed by this chunk
+        """
+        if self._buf:
+            # only decode once the buffered frame is complete, so a large
+            # frame fed in small pieces is appended in linear time
+            self._buf += chunk
+            if self._need < 0:
+                self._update_need()
+            if self._need < 0 or len(self._buf) < self._need:
+                return []
+            data = self._buf
+            self._buf = bytearray()
+        else:
+            data = chunk
+
+        view = memoryview(data).cast("B")
+        frames = list(self._frames(view, 0, len(view)))
+        if self._pos < len(view):
+            self._buf += view[self._pos:]
+            self._update_need()
+        return frames
+
+    def pending(self)->int:
+        """Number of buffered bytes belonging to an incomplete frame"""
+        return len(self._buf)
+
+
 if __name__=="__main__":
     something = ["neet", "code", "love", "you"]
 
@@ -35,3 +175,11 @@ if __name__=="__main__":
 
     print(res.decode(temp))
 
+    encoded = encode_frames([s.encode() for s in something], varint=True)
+    print([bytes(frame).decode() for frame in decode_frames(encoded, varint=True)])
+
+    decoder = FrameDecoder(varint=True)
+    frames = []
+    for i in range(0, len(encoded), 3):
+        frames += decoder.feed(encoded[i:i+3])
+    print([bytes(frame).decode() for frame in frames])
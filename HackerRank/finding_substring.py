@@ -1,10 +1,205 @@
+from __future__ import annotations
+
+import sys
+
+
 def merge_the_tools(string:str, k:int):
     # your code goes here
-    num_substrings = int(len(string)/k)
-    
-    for i in range(num_substrings):
-        substring = string[i:i+k]
-        print(substring)
+    num_substrings = len(string) - k + 1
+    sys.stdout.write("".join(string[i:i+k] + "\n" for i in range(num_substrings)))
+
+
+# Two independent Rabin-Karp hashes combined into one 62 bit key per window
+_MODS = (2**31 - 1, 2**31 - 19)
+_BASES = (911382323, 972663749)
+
+
+def _code_points(text)->np.ndarray:
+    import numpy as np
+
+    if isinstance(text, str):
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    return np.frombuffer(bytes(text), dtype=np.uint8).astype(np.uint64)
+
+
+def _window_hashes(codes:np.ndarray, k:int, base:int, mod:int)->np.ndarray:
+    """
+    Hash of every k-length window, hash(s) = sum(s[j] * base**(k-1-j)) % mod,
+    built by doubling window lengths so it takes O(n log k) vectorized work
+    """
+    import numpy as np
+
+    base = np.uint64(base)
+    mod = np.uint64(mod)
+
+    res = None                                                  # hashes of windows of length `length`
+    length = 0
+    power = codes % mod                                         # hashes of windows of length `step`
+    step = 1
+    pow_step = base % mod                                       # base**step % mod
+    remaining = k
+
+    while True:
+        if remaining & 1:
+            if res is None:
+                res = power
+            else:
+                # append a window of length `step` to the right of each current window
+                n = len(codes) - (length + step) + 1
+                res = (res[:n] * pow_step + power[length:length + n]) % mod
+            length += step
+        remaining >>= 1
+        if not remaining:
+            return res
+        n = len(power) - step
+        power = (power[:n] * pow_step + power[step:step + n]) % mod
+        step *= 2
+        pow_step = pow_step * pow_step % mod
+
+
+class KGramIndex:
+    """
+    Index of all k-length windows of a text by rolling hash.
+
+    Windows are grouped by their hash key, so counting and lookup never
+    materialize substrings. Keys are 62 bit double hashes; lookup verifies
+    candidates against the text, counts assume no collisions.
+    """
+
+    def __init__(self, text, k:int):
+        import numpy as np
+
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.text = text
+        self.k = k
+        codes = _code_points(text)
+
+        if len(codes) < k:
+            keys = np.empty(0, dtype=np.uint64)
+        else:
+            h1 = _window_hashes(codes, k, _BASES[0], _MODS[0])
+            h2 = _window_hashes(codes, k, _BASES[1], _MODS[1])
+            keys = (h1 << np.uint64(31)) | h2
+
+        self.keys = keys
+        self.order = np.argsort(keys, kind="stable")             # window positions grouped by key
+        self.unique_keys, self.starts, self.counts = np.unique(
+            keys[self.order], return_index=True, return_counts=True)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _key(self, pattern)->int:
+        import numpy as np
+
+        codes = _code_points(pattern)
+        h1 = _window_hashes(codes, self.k, _BASES[0], _MODS[0])
+        h2 = _window_hashes(codes, self.k, _BASES[1], _MODS[1])
+        return (h1[0] << np.uint64(31)) | h2[0]
+
+    def _group(self, pattern)->int:
+        import numpy as np
+
+        if len(pattern) != self.k:
+            raise ValueError(f"pattern must have length {self.k}")
+        key = self._key(pattern)
+        i = np.searchsorted(self.unique_keys, key)
+        if i < len(self.unique_keys) and self.unique_keys[i] == key:
+            return i
+        return -1
+
+    def lookup(self, pattern)->np.ndarray:
+        """
+        Returns:
+            sorted start positions of pattern in the text
+        """
+        import numpy as np
+
+        i = self._group(pattern)
+        if i < 0:
+            return np.empty(0, dtype=np.intp)
+        pos = np.sort(self.order[self.starts[i]:self.starts[i] + self.counts[i]])
+        if self.text[pos[0]:pos[0] + self.k] != pattern:              # hash collision
+            return np.empty(0, dtype=np.intp)
+        return pos
+
+    def count(self, pattern)->int:
+        i = self._group(pattern)
+        return int(self.counts[i]) if i >= 0 else 0
+
+    def most_common(self, n:int=1)->list[tuple]:
+        """
+        Returns:
+            list of (k-gram, count) for the n most frequent k-grams
+        """
+        import numpy as np
+
+        top = np.argsort(self.counts, kind="stable")[::-1][:n]
+        res = []
+        for i in top:
+            pos = self.order[self.starts[i]]
+            res.append((self.text[pos:pos + self.k], int(self.counts[i])))
+        return res
+
+
+class SuffixArray:
+    """
+    Suffix array built by prefix doubling, for exact search of patterns
+    of any length in O(m log n) per query
+    """
+
+    def __init__(self, text):
+        import numpy as np
+
+        self.text = text
+        codes = _code_points(text).astype(np.int64)
+        n = len(codes)
+
+        rank = codes
+        sa = np.argsort(rank, kind="stable")
+        length = 1
+        while length < n:
+            second = np.full(n, -1, dtype=np.int64)
+            second[:n - length] = rank[length:]
+            sa = np.lexsort((second, rank))
+            pairs = np.stack([rank[sa], second[sa]])
+            changed = np.any(pairs[:, 1:] != pairs[:, :-1], axis=0)
+            new_rank = np.empty(n, dtype=np.int64)
+            new_rank[sa] = np.concatenate([[0], np.cumsum(changed)])
+            rank = new_rank
+            if rank.max() == n - 1:
+                break
+            length *= 2
+
+        self.sa = sa
+
+    def _bound(self, pattern, upper:bool)->int:
+        lo, hi = 0, len(self.sa)
+        m = len(pattern)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            prefix = self.text[self.sa[mid]:self.sa[mid] + m]
+            if prefix < pattern or (upper and prefix == pattern):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, pattern)->np.ndarray:
+        """
+        Returns:
+            sorted start positions of pattern in the text
+        """
+        import numpy as np
+
+        lo = self._bound(pattern, upper=False)
+        hi = self._bound(pattern, upper=True)
+        return np.sort(self.sa[lo:hi])
+
+    def count(self, pattern)->int:
+        return self._bound(pattern, upper=True) - self._bound(pattern, upper=False)
+
 
 if __name__ == '__main__':
     string, k = input(), int(input())
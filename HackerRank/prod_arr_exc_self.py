@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 class Solution:
     def productExceptSelf(self, nums: list[int]) -> list[int]:
         res = [1] * (len(nums))
@@ -11,8 +13,236 @@ class Solution:
             res[i] *= postfix
             postfix *= nums[i]
         return res
-    
-nums = [-1,0,1,2,3]
 
-something = Solution()
-print(something.productExceptSelf(nums))
+
+def _exclusive_scan(arr:np.ndarray, op, reverse:bool=False)->np.ndarray:
+    """
+    Exclusive scan with ufunc op (np.multiply or np.add) along the last
+    axis, ie. out[..., i] combines arr[..., :i] (or arr[..., i+1:] if reverse)
+    """
+    import numpy as np
+
+    if reverse:
+        return _exclusive_scan(arr[..., ::-1], op)[..., ::-1]
+
+    out = np.full_like(arr, op.identity)
+    if arr.shape[-1] > 1:
+        op.accumulate(arr[..., :-1], axis=-1, out=out[..., 1:])
+    return out
+
+def _zero_mask(is_zero:np.ndarray, zeros_total)->np.ndarray:
+    """
+    Mask of positions that have a zero among the *other* elements
+    """
+    import numpy as np
+
+    return (np.expand_dims(zeros_total, -1) - is_zero) > 0
+
+def product_except_self(nums)->np.ndarray:
+    """
+    Function to compute product of array except self using cumulative products
+
+    Args:
+        nums: 1-D array, or 2-D array processed row-wise
+
+    Returns:
+        Array of the same shape. Integer dtypes wrap on overflow, use
+        product_except_self_mod or product_except_self_log for large inputs
+    """
+    import numpy as np
+
+    arr = np.asarray(nums)
+    res = _exclusive_scan(arr, np.multiply) * _exclusive_scan(arr, np.multiply, reverse=True)
+
+    # without this an overflowed float prefix (inf) times 0 gives nan
+    is_zero = arr == 0
+    res[_zero_mask(is_zero, np.count_nonzero(is_zero, axis=-1))] = 0
+    return res
+
+def _log_parts(arr:np.ndarray)->tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split arr into log|x| (0 for zeros), negative flags and zero flags
+    """
+    import numpy as np
+
+    is_zero = arr == 0
+    logs = np.log(np.abs(np.where(is_zero, 1.0, arr)))
+    return logs, (arr < 0).astype(np.int64), is_zero
+
+def product_except_self_log(nums)->tuple[np.ndarray, np.ndarray]:
+    """
+    Function to compute product of array except self in log-space, so it
+    neither overflows nor underflows
+
+    Args:
+        nums: 1-D array, or 2-D array processed row-wise
+
+    Returns:
+        (sign, logabs) such that the result is sign * exp(logabs); sign is
+        0 (and logabs -inf) where the product is zero
+    """
+    import numpy as np
+
+    arr = np.asarray(nums, dtype=np.float64)
+    logs, is_neg, is_zero = _log_parts(arr)
+    logabs = logs.sum(axis=-1, keepdims=True) - logs
+
+    negatives = np.count_nonzero(is_neg, axis=-1)
+    sign = np.where((np.expand_dims(negatives, -1) - is_neg) % 2, -1.0, 1.0)
+
+    zero_res = _zero_mask(is_zero, np.count_nonzero(is_zero, axis=-1))
+    sign[zero_res] = 0.0
+    logabs[zero_res] = -np.inf
+    return sign, logabs
+
+def _cumprod_mod(arr:np.ndarray, mod)->np.ndarray:
+    """
+    Inclusive cumulative product modulo mod along the last axis, using a
+    log2(n) step vectorized scan so intermediates stay below mod**2
+    """
+    out = arr.copy()
+    shift = 1
+    while shift < out.shape[-1]:
+        out[..., shift:] = out[..., shift:] * out[..., :-shift] % mod
+        shift *= 2
+    return out
+
+def _exclusive_cumprod_mod(arr:np.ndarray, mod, reverse:bool=False)->np.ndarray:
+    import numpy as np
+
+    if reverse:
+        return _exclusive_cumprod_mod(arr[..., ::-1], mod)[..., ::-1]
+
+    out = np.ones_like(arr)
+    if arr.shape[-1] > 1:
+        out[..., 1:] = _cumprod_mod(arr[..., :-1], mod)
+    return out
+
+def _as_residues(nums, mod:int)->tuple[np.ndarray, np.uint64]:
+    import numpy as np
+
+    if not 1 < mod <= 2**32:
+        raise ValueError("mod must be in (1, 2**32]")
+    return np.mod(np.asarray(nums, dtype=np.int64), mod).astype(np.uint64), np.uint64(mod)
+
+def product_except_self_mod(nums, mod:int)->np.ndarray:
+    """
+    Function to compute product of integer array except self modulo mod
+
+    Args:
+        nums: 1-D integer array, or 2-D array processed row-wise
+        mod: modulus, at most 2**32 so products fit in uint64
+
+    Returns:
+        Array of the same shape with values in [0, mod)
+    """
+    import numpy as np
+
+    arr, mod = _as_residues(nums, mod)
+    res = _exclusive_cumprod_mod(arr, mod) * _exclusive_cumprod_mod(arr, mod, reverse=True) % mod
+    return res.astype(np.int64)
+
+def product_except_self_chunked(nums, out=None, chunk_size:int=1 << 20,
+                                mod:int=None, log:bool=False, sign_out=None):
+    """
+    Function to compute product of a 1-D array except self in chunks, so
+    inputs bigger than RAM (eg. np.memmap / np.load(..., mmap_mode='r'))
+    are processed with bounded memory. The running prefix and suffix are
+    carried between chunks, modulo mod or in log-space when requested so
+    the out-of-core path does not overflow either.
+
+    Args:
+        nums: 1-D array-like supporting slicing, typically a memmap
+        out: array to write the result into (eg. a writable memmap),
+             allocated in memory if None. Holds log|product| if log
+        chunk_size: number of elements per chunk
+        mod: compute the products modulo mod (integers, at most 2**32)
+        log: compute in log-space like product_except_self_log
+        sign_out: array for the signs if log, allocated if None
+
+    Returns:
+        out, or (sign_out, out) if log
+    """
+    import numpy as np
+
+    if mod is not None and log:
+        raise ValueError("mod and log can't be combined")
+
+    n = len(nums)
+    if out is None:
+        dtype = np.int64 if mod is not None else np.float64 if log else nums.dtype
+        out = np.empty(n, dtype=dtype)
+    if log and sign_out is None:
+        sign_out = np.empty(n, dtype=np.float64)
+
+    def chunks(reverse:bool):
+        starts = range(0, n, chunk_size)
+        for start in reversed(starts) if reverse else starts:
+            yield slice(start, min(start + chunk_size, n))
+
+    zeros = 0
+
+    if mod is not None:
+        for reverse in (False, True):
+            carry = np.uint64(1)
+            for sl in chunks(reverse):
+                arr, m = _as_residues(nums[sl], mod)
+                part = _exclusive_cumprod_mod(arr, m, reverse) * carry % m
+                if reverse:
+                    out[sl] = (np.asarray(out[sl]).astype(np.uint64) * part % m).astype(np.int64)
+                else:
+                    out[sl] = part.astype(np.int64)
+                carry = carry * _cumprod_mod(arr, m)[-1] % m
+        return out
+
+    if log:
+        for reverse in (False, True):
+            log_carry = 0.0
+            neg_carry = 0
+            for sl in chunks(reverse):
+                logs, is_neg, is_zero = _log_parts(np.asarray(nums[sl], dtype=np.float64))
+                part_log = _exclusive_scan(logs, np.add, reverse) + log_carry
+                part_neg = _exclusive_scan(is_neg, np.add, reverse) + neg_carry
+                if reverse:
+                    logabs = np.asarray(out[sl]) + part_log
+                    sign = np.where((np.asarray(sign_out[sl]).astype(np.int64) + part_neg) % 2, -1.0, 1.0)
+                    zero_res = _zero_mask(is_zero, zeros)
+                    sign[zero_res] = 0.0
+                    logabs[zero_res] = -np.inf
+                    out[sl] = logabs
+                    sign_out[sl] = sign
+                else:
+                    # the forward pass stores negative counts in sign_out
+                    out[sl] = part_log
+                    sign_out[sl] = part_neg
+                    zeros += np.count_nonzero(is_zero)
+                log_carry += logs.sum()
+                neg_carry += int(is_neg.sum())
+        return sign_out, out
+
+    # forward pass: exclusive prefix products, carrying the running product
+    carry = np.ones((), dtype=out.dtype)
+    for sl in chunks(False):
+        chunk = np.asarray(nums[sl])
+        out[sl] = _exclusive_scan(chunk, np.multiply) * carry
+        carry = carry * np.prod(chunk)
+        zeros += np.count_nonzero(chunk == 0)
+
+    # backward pass: multiply in exclusive suffix products
+    carry = np.ones((), dtype=out.dtype)
+    for sl in chunks(True):
+        chunk = np.asarray(nums[sl])
+        res = np.asarray(out[sl]) * _exclusive_scan(chunk, np.multiply, reverse=True) * carry
+        res[_zero_mask(chunk == 0, zeros)] = 0
+        out[sl] = res
+        carry = carry * np.prod(chunk)
+
+    return out
+
+
+if __name__ == "__main__":
+    nums = [-1,0,1,2,3]
+
+    something = Solution()
+    print(something.productExceptSelf(nums))
+    print(product_except_self(nums))
@@ -1,18 +1,124 @@
-def merge_the_tools(string:str, k:int):
+import mmap
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+def merge_the_tools(string:str, k:int, out=None):
     # your code goes here
-    for i in range(0, len(string), k):
-        substring = string[i:i+k]
-        
-        seen_chars = set()
-        uniq_char_list = []
-
-        for char in substring:
-            if char not in seen_chars:
-                uniq_char_list.append(char)
-                seen_chars.add(char)
-
-        print("".join(uniq_char_list))
-    
+    out = out or sys.stdout
+
+    # dict.fromkeys keeps first occurrences in order, deduplicating in C
+    out.write("".join("".join(dict.fromkeys(string[i:i+k])) + "\n"
+                      for i in range(0, len(string), k)))
+
+
+def _dedup_block(block:bytes, k:int)->bytes:
+    """
+    Deduplicate characters of every k-byte chunk of block, one output line
+    per chunk. Uses a vectorized NumPy path when available.
+    """
+    if not block.isascii():
+        raise ValueError("merge_the_tools_file needs ASCII input, use merge_the_tools for other text")
+
+    try:
+        import numpy as np
+    except ImportError:
+        return b"".join(bytes(dict.fromkeys(block[i:i+k])) + b"\n"
+                        for i in range(0, len(block), k))
+
+    full = len(block) - len(block) % k
+    rows = np.frombuffer(block, dtype=np.uint8, count=full).reshape(-1, k)
+
+    # a byte is kept if it differs from its predecessor in a stable sort of the row
+    order = np.argsort(rows, axis=1, kind="stable")
+    ranked = np.take_along_axis(rows, order, axis=1)
+    first = np.ones(rows.shape, dtype=bool)
+    first[:, 1:] = ranked[:, 1:] != ranked[:, :-1]
+    keep = np.empty_like(first)
+    np.put_along_axis(keep, order, first, axis=1)
+
+    # append a newline column and flatten in one go
+    lines = np.hstack([rows, np.full((len(rows), 1), ord("\n"), dtype=np.uint8)])
+    mask = np.hstack([keep, np.ones((len(rows), 1), dtype=bool)])
+    res = lines[mask].tobytes()
+
+    if full < len(block):
+        res += bytes(dict.fromkeys(block[full:])) + b"\n"
+    return res
+
+
+def _dedup_range(path:str, k:int, start:int, stop:int, block_size:int, out):
+    """
+    Deduplicate the chunks of path[start:stop] block by block, writing each
+    block's lines to out as soon as it is done so memory stays bounded
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(start, stop, block_size):
+            out.write(_dedup_block(mm[i:min(i + block_size, stop)], k))
+
+
+def _dedup_range_to_file(path:str, k:int, start:int, stop:int, block_size:int, part_path:str)->str:
+    with open(part_path, "wb", buffering=1 << 20) as out:
+        _dedup_range(path, k, start, stop, block_size, out)
+    return part_path
+
+
+def merge_the_tools_file(in_path:str, out_path:str, k:int,
+                         block_size:int=1 << 22, workers:int=1):
+    """
+    Function to run merge_the_tools over a large file. Chunks are cut on
+    bytes, so the input must be ASCII (ValueError otherwise) for the
+    output to match merge_the_tools.
+
+    Args:
+        in_path: ASCII input file holding the string (a trailing \n or
+                 \r\n is ignored)
+        out_path: output file, one deduplicated chunk per line
+        k: chunk length in bytes (= characters for ASCII)
+        block_size: bytes read per block, rounded down to a multiple of k
+        workers: number of processes to split chunk ranges across
+    """
+    block_size = max(k, block_size - block_size % k)
+
+    size = os.path.getsize(in_path)
+    if size:
+        with open(in_path, "rb") as f:
+            f.seek(max(size - 2, 0))
+            tail = f.read()
+        if tail.endswith(b"\r\n"):
+            size -= 2
+        elif tail.endswith(b"\n"):
+            size -= 1
+
+    with open(out_path, "wb", buffering=1 << 20) as out:
+        if size == 0:
+            return
+
+        if workers <= 1:
+            _dedup_range(in_path, k, 0, size, block_size, out)
+            return
+
+        # split into k-aligned ranges, each worker writes its own part file
+        # which is then appended to the output in order
+        step = -(-size // workers)
+        step += -step % k
+        ranges = range(0, size, step)
+        parts = [f"{out_path}.part{i}" for i in range(len(ranges))]
+        try:
+            with ProcessPoolExecutor(workers) as pool:
+                for part in pool.map(_dedup_range_to_file, [in_path] * len(ranges), [k] * len(ranges),
+                                     ranges, [min(s + step, size) for s in ranges],
+                                     [block_size] * len(ranges), parts):
+                    with open(part, "rb") as f:
+                        shutil.copyfileobj(f, out, 1 << 20)
+                    os.remove(part)
+        finally:
+            for part in parts:
+                if os.path.exists(part):
+                    os.remove(part)
+
 
 if __name__ == '__main__':
     string, k = input(), int(input())
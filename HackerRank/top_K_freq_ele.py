@@ -1,26 +1,144 @@
 # Input: nums = [1,2,2,3,3,3], k=2
 # Output: [2,3]
 
+import heapq
+from collections import Counter
+
 class Solution:
     def topKFrequent(self, nums: list[int], k:int)->list[int]:
-        count = {}
-
-        for num in nums:
-            count[num] = 1 + count.get(num, 0)
+        if k <= 0:
+            return []
 
-        print(count)
+        count = Counter(nums)
 
-        arr = []
+        # bucket sort by frequency, O(n)
+        buckets = [[] for _ in range(len(nums) + 1)]
         for num, cnt in count.items():
-            arr.append([cnt, num])
-        arr.sort()
+            buckets[cnt].append(num)
 
         res = []
-        while len(res)<k:
-            res.append(arr.pop()[1])
+        for cnt in range(len(buckets) - 1, 0, -1):
+            for num in buckets[cnt]:
+                res.append(num)
+                if len(res) == k:
+                    return res
 
         return res
 
+    def topKFrequentHeap(self, nums: list[int], k:int)->list[int]:
+        count = Counter(nums)
+        return heapq.nlargest(k, count, key=count.__getitem__)
+
+    def topKFrequentNumpy(self, nums, k:int)->list[int]:
+        if k <= 0:
+            return []
+
+        import numpy as np
+
+        values, counts = np.unique(np.asarray(nums), return_counts=True)
+        if k >= len(values):
+            idx = np.argsort(counts)[::-1]
+        else:
+            idx = np.argpartition(counts, -k)[-k:]
+            idx = idx[np.argsort(counts[idx])[::-1]]
+        return values[idx].tolist()
+
+
+class SpaceSaving:
+    """
+    Streaming approximate top-K (Space-Saving algorithm) using a fixed
+    number of counters.
+
+    With m counters over a stream of N items every reported count
+    overestimates the true count by at most N/m, and every item occurring
+    more than N/m times is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity:int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        self._heap = []                                         # (count, seq, item), stale entries skipped lazily
+        self._seq = 0                                           # tiebreak so items themselves are never compared
+
+    def _min_item(self):
+        heap = self._heap
+        while True:
+            cnt, _, item = heap[0]
+            if self.counts.get(item) == cnt:
+                return item
+            heapq.heappop(heap)
+
+    def _rebuild_heap(self):
+        self._heap = [(cnt, seq, item) for seq, (item, cnt) in enumerate(self.counts.items())]
+        self._seq = len(self._heap)
+        heapq.heapify(self._heap)
+
+    def update(self, item, count:int=1):
+        self.total += count
+
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            evicted = self._min_item()
+            floor = self.counts.pop(evicted)
+            del self.errors[evicted]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+
+        heapq.heappush(self._heap, (self.counts[item], self._seq, item))
+        self._seq += 1
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def extend(self, items):
+        for item in items:
+            self.update(item)
+
+    def error_bound(self)->float:
+        return self.total / self.capacity
+
+    def top(self, k:int)->list[tuple]:
+        """
+        Returns:
+            list of (item, estimated count, max overestimate) for the k
+            most frequent tracked items
+        """
+        items = heapq.nlargest(k, self.counts, key=self.counts.__getitem__)
+        return [(item, self.counts[item], self.errors[item]) for item in items]
+
+    def merge(self, other:"SpaceSaving")->"SpaceSaving":
+        """
+        Combine two summaries (eg. built by parallel workers) into a new
+        one with the same error guarantee over the concatenated streams.
+        Both summaries must have the same capacity.
+        """
+        if self.capacity != other.capacity:
+            raise ValueError("can only merge summaries with the same capacity")
+        capacity = self.capacity
+        min_a = min(self.counts.values()) if len(self.counts) == self.capacity else 0
+        min_b = min(other.counts.values()) if len(other.counts) == other.capacity else 0
+
+        counts = {}
+        errors = {}
+        for item in self.counts.keys() | other.counts.keys():
+            counts[item] = self.counts.get(item, min_a) + other.counts.get(item, min_b)
+            errors[item] = self.errors.get(item, min_a) + other.errors.get(item, min_b)
+
+        merged = SpaceSaving(capacity)
+        merged.total = self.total + other.total
+        for item in heapq.nlargest(capacity, counts, key=counts.__getitem__):
+            merged.counts[item] = counts[item]
+            merged.errors[item] = errors[item]
+        merged._rebuild_heap()
+        return merged
+
 
 if __name__ =="__main__":
     nums = [1,2,2,3,3,3]
@@ -30,4 +148,8 @@ if __name__ =="__main__":
 
     print(res.topKFrequent(nums, k))
     print(res.topKFrequent([7,7], 1))
+    print(res.topKFrequentHeap(nums, k))
 
+    sketch = SpaceSaving(capacity=2)
+    sketch.extend(nums)
+    print(sketch.top(k), sketch.error_bound())
@@ -3,8 +3,7 @@ Script to find minima of functions (quadratic) using
 two numerical methods Newton Raphson & Bisection
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
+import math
 
 
 def plot_parabola(c_1:int, c_2:int, c_3:int):
@@ -18,6 +17,9 @@ def plot_parabola(c_1:int, c_2:int, c_3:int):
         c_3: Constant
     """
 
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     x_vals = np.arange(-10.0, 10.0, 0.2)
 
     plt.plot(x_vals, eval_func(c_1, c_2, c_3, x_vals))
@@ -47,7 +49,8 @@ def eval_func(c_1:int, c_2:int, c_3:int, x:float) -> float:
 
 
 
-def bisection_method(c_1:int, c_2:int, c_3:int, init_x_1:float, init_x_2:float) -> float:
+def bisection_method(c_1:int, c_2:int, c_3:int, init_x_1:float, init_x_2:float,
+                     plot:bool=True) -> float:
     """
     Function to find root of equation using bisection method
 
@@ -57,7 +60,7 @@ def bisection_method(c_1:int, c_2:int, c_3:int, init_x_1:float, init_x_2:float)
         c_3: Constant
         init_x_1: Lower bound where function is negative
         init_x_2: Upper bound where function is positive
-        tol: Tolerance for convergence
+        plot: bool to indicate whether to plot the results
 
     Returns:
         Root of equation within specified tolerance
@@ -91,14 +94,41 @@ def bisection_method(c_1:int, c_2:int, c_3:int, init_x_1:float, init_x_2:float)
             f_mid_list.append(f_mid)
             x_mid_list.append(x_mid)
 
-        tol_list.append(np.log10(tol))
+        tol_list.append(math.log10(tol))
         nsteps_list.append(nsteps)
 
-    # Plotting the results 
+    if plot:
+        plot_results(c_1, c_2, c_3, x_mid_list, f_mid_list, tol_list, nsteps_list, "Bisection")
+
+    print(f"Root found at x = {x_mid} after {nsteps} iterations")
+    return x_mid
+
+
+
+def plot_results(c_1:int, c_2:int, c_3:int, x_list:list, fx_list:list,
+                 tol_list:list, nsteps_list:list, method:str):
+    """
+    Function to plot the points visited by a root finding method and the
+    number of steps needed for each tolerance
+
+    Args:
+        c_1: Coefficient of x^2
+        c_2: Coefficient of x
+        c_3: Constant
+        x_list: x values visited by the method
+        fx_list: function values at x_list
+        tol_list: log10 of the tolerances used
+        nsteps_list: number of steps taken for each tolerance
+        method: name of the method, used in titles
+    """
+
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     fig, axs = plt.subplots(2, 1, figsize=(6, 6))
     axs[0].plot(np.arange(-10.0, 10.0, 0.2), eval_func(c_1, c_2, c_3, np.arange(-10.0, 10.0, 0.2)), label='f(x)')
-    axs[0].plot(x_mid_list, f_mid_list, 'ro-', label='Bisection Points')
-    axs[0].set_title(r"Bisection Method: $f(x) = {:+}x^2{:+}x{:+}$".format(c_1, c_2, c_3))
+    axs[0].plot(x_list, fx_list, 'ro-', label=f'{method} Points')
+    axs[0].set_title(method + r" Method: $f(x) = {:+}x^2{:+}x{:+}$".format(c_1, c_2, c_3))
     axs[0].set_xlabel("x")
     axs[0].set_ylabel("f(x)")
     axs[0].axhline(0, color='black', lw=0.5, ls='solid')
@@ -114,17 +144,14 @@ def bisection_method(c_1:int, c_2:int, c_3:int, init_x_1:float, init_x_2:float)
     axs[1].axvline(0, color='black', lw=0.5, ls='solid')
     axs[1].grid(True)
 
-    fig.suptitle("Bisection Method Results", fontsize = 16)
+    fig.suptitle(f"{method} Method Results", fontsize = 16)
 
     plt.tight_layout()
     plt.show()
 
-    print(f"Root found at x = {x_mid} after {nsteps} iterations")
-    return x_mid
 
 
-
-def NR_method(c_1:int, c_2:int, c_3:int, init_x:float=-5) -> float:
+def NR_method(c_1:int, c_2:int, c_3:int, init_x:float=-5, plot:bool=True) -> float:
     """
     Function to find root of equation using Newton-Raphson method
 
@@ -133,7 +160,7 @@ def NR_method(c_1:int, c_2:int, c_3:int, init_x:float=-5) -> float:
         c_2: Coefficient of x
         c_3: Constant
         init_x: Initial guess for the root
-        tol: Tolerance for convergence
+        plot: bool to indicate whether to plot the results
 
     Returns:
         Root of equation within specified tolerance
@@ -162,35 +189,13 @@ def NR_method(c_1:int, c_2:int, c_3:int, init_x:float=-5) -> float:
             f_prime_x = 2*c_1*x + c_2
 
         nsteps_list.append(nsteps)
-        tol_list.append(np.log10(tol))
+        tol_list.append(math.log10(tol))
         x_list.append(x)
         fx_list.append(f_x)
 
 
-    # Plotting the results
-    fig, axs = plt.subplots(2, 1, figsize=(6, 6))
-    axs[0].plot(np.arange(-10.0, 10.0, 0.2), eval_func(c_1, c_2, c_3, np.arange(-10.0, 10.0, 0.2)), label='f(x)')
-    axs[0].plot(x_list, fx_list, 'ro-', label='Newton-Raphson Points')
-    axs[0].set_title(r"Newton-Raphson Method: $f(x) = {:+}x^2{:+}x{:+}$".format(c_1, c_2, c_3))
-    axs[0].set_xlabel("x")
-    axs[0].set_ylabel("f(x)")
-    axs[0].axhline(0, color='black', lw=0.5, ls='solid')
-    axs[0].axvline(0, color='black', lw=0.5, ls='solid')
-    axs[0].grid(True)
-    axs[0].legend()
-
-    axs[1].plot(tol_list, nsteps_list, '.-')
-    axs[1].set_title("Number of Steps for Different Tolerances")
-    axs[1].set_xlabel(r"$Log_{10}(Tolerance)$")
-    axs[1].set_ylabel("Number of Steps")
-    axs[1].axhline(0, color='black', lw=0.5, ls='solid')
-    axs[1].axvline(0, color='black', lw=0.5, ls='solid')
-    axs[1].grid(True)
-
-    fig.suptitle("Newton-Raphson Method Results", fontsize = 16)
-
-    plt.tight_layout()
-    plt.show()
+    if plot:
+        plot_results(c_1, c_2, c_3, x_list, fx_list, tol_list, nsteps_list, "Newton-Raphson")
 
     print(f"Root found at x = {x} after {nsteps} iterations")
     return x
@@ -4,10 +4,18 @@ numerical integration Implemented for pendulum
 """
 
 import math 
-import matplotlib.pyplot as plt
 
 
-def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True)->float:
+#constants for part 7
+k=0.0                                                                           #damping constant
+phi=0.6667                                                                      #initial phase
+A=0.0                                                                           #Amplitude
+g=1                                                                             #gravity
+L=1                                                                             #Length of the pendulum
+
+
+def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True,
+                 k:float=k, A:float=A, phi:float=phi, g:float=g, L:float=L)->float:
     """
     Function to return solved equation of moition for a pendulum
 
@@ -16,6 +24,11 @@ def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True)->fl
         omega: value for angular velocity (d_theta/time_step)
         time: value for time
         sin_approx: bool to indicate whether to use sin theta approximation or not
+        k: damping constant
+        A: amplitude of the driving force
+        phi: frequency of the driving force
+        g: gravity
+        L: length of the pendulum
 
     Return:
         motion: Value for equation of motion at current time 
@@ -33,49 +46,72 @@ def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True)->fl
     return motion
 
 
-#constants for part 7
-k=0.0                                                                           #damping constant
-phi=0.6667                                                                      #initial phase
-A=0.0                                                                           #Amplitude
-g=1                                                                             #gravity
-L=1                                                                             #Length of the pendulum
-
-if __name__=="__main__":
-    theta=3.0                                                                       #value of theta
-    omega=0.0                                                                       #angular velocity
-    t=0.0                                                                           #time
-    dt=0.01                                                                         #increments with which time will increase
+def evolve_pendulum(theta:float, omega:float, total_time:int=1000,
+                    time_step:float=0.01, sin_approx:bool=False,
+                    k:float=k, A:float=A, phi:float=phi, g:float=g, L:float=L)->tuple[list, list, list]:
+    """
+    Evolving the pendulum equation using fourth order Runge-Kutta
 
+    Args:
+        theta: initial value of theta
+        omega: intial angular velocity
+        total_time: total number of steps to be used
+        time_step: value for incrementing time value
+        sin_approx: bool to indicate whether to use sin theta approximation or not
+        k: damping constant
+        A: amplitude of the driving force
+        phi: frequency of the driving force
+        g: gravity
+        L: length of the pendulum
 
-    #initializing lists for storing values of theta, omega and time so they could be easily plotted on the graph
-    theta_list=[theta]                                                              #list for theta
-    omega_list=[omega]                                                              #list for omega
-    t_list=[t]                                                                      #list for time 
+    Return:
+        Lists of time, theta and omega values
+    """
 
+    params = dict(k=k, A=A, phi=phi, g=g, L=L)
+    t = 0.0
+    dt = time_step
+    theta_list = [theta]
+    omega_list = [omega]
+    t_list = [t]
 
-    #loop for finding the area of the trapezoid using Range-kutta method
-    for i in range(1,1000):                                                         #the end value of 1000 was instructed to be used in the lab manual 
-        #to avoid confusion k1a, k1b, k2a, k2b, k3a, k3b, k4a and k4b are used calculate parts of equation (21) and (22)
+    for i in range(1, total_time):
         k1a = dt * omega
-        k1b = dt * eqn_pendulum(theta, omega, t, sin_approx=False)
-        k2a = dt * (omega + k1b/2)  
-        k2b = dt * eqn_pendulum(theta + k1a/2, omega + k1b/2, t + dt/2, sin_approx=False)
+        k1b = dt * eqn_pendulum(theta, omega, t, sin_approx=sin_approx, **params)
+        k2a = dt * (omega + k1b/2)
+        k2b = dt * eqn_pendulum(theta + k1a/2, omega + k1b/2, t + dt/2, sin_approx=sin_approx, **params)
         k3a = dt * (omega + k2b/2)
-        k3b = dt * eqn_pendulum(theta + k2a/2, omega + k2b/2, t + dt/2, sin_approx=False)
+        k3b = dt * eqn_pendulum(theta + k2a/2, omega + k2b/2, t + dt/2, sin_approx=sin_approx, **params)
         k4a = dt * (omega + k3b)
-        k4b = dt * eqn_pendulum(theta + k3a, omega + k3b, t + dt, sin_approx=False)
+        k4b = dt * eqn_pendulum(theta + k3a, omega + k3b, t + dt, sin_approx=sin_approx, **params)
+
+        theta = theta + (k1a + 2 * k2a + 2 * k3a + k4a)/6
+        omega = omega + (k1b + 2 * k2b + 2 * k3b + k4b)/6
+        t = t + dt
+
+        theta_list.append(theta)
+        omega_list.append(omega)
+        t_list.append(t)
+
+    return t_list, theta_list, omega_list
 
-        theta=theta + (k1a + 2 * k2a + 2 * k3a + k4a)/6                             #calculating the value for equation (21) and updating the value of theta
-        omega=omega + (k1b + 2 * k2b + 2 * k3b + k4b)/6                             #caluclating the value for equation (22) and updating the value of omega
-        t=t+dt                                                                      #incrementing the value of t(time)
 
-        theta_list.append(theta)                                                    #appending the updated value of theta
-        omega_list.append(omega)                                                    #appending the updated value of omega
-        t_list.append(t)                                                            #appending the updated value of t(time)
+def plot_pendulum(t_list:list, theta_list:list, omega_list:list, title:str):
+    """
+    Function to plot theta and omega against time
+
+    Args:
+        t_list: time values
+        theta_list: theta values
+        omega_list: angular velocity values
+        title: first line of the plot title
+    """
+
+    import matplotlib.pyplot as plt
 
     plt.plot(t_list, omega_list, "blue", label=r"Angular Velocity, $\omega$")
     plt.plot(t_list, theta_list, "red", label=r"Theta $\theta$")
-    plt.title("Solving Non-Linear Pendulumn Equation with initial conditions\n"+
+    plt.title(title + "\n" +
               "Runge-Kutta Method\n"
               r"$\theta$ = {:.2f} radians | $\omega$ = {:.2f} rad/s".format(theta_list[0], omega_list[0]),
                 wrap=True)
@@ -84,3 +120,9 @@ if __name__=="__main__":
     plt.ylim(-math.pi, math.pi)
     plt.grid()
     plt.show()
+
+
+if __name__=="__main__":
+    t_list, theta_list, omega_list = evolve_pendulum(theta=3.0, omega=0.0)
+    plot_pendulum(t_list, theta_list, omega_list,
+                  "Solving Non-Linear Pendulumn Equation with initial conditions")
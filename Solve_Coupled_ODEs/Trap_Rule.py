@@ -3,11 +3,19 @@ Script to implement Trapezoidal method and using it to solve
 Linear and Non-Linear pendulum 
 """
 
-import matplotlib.pyplot as plt
 import math
 
 
-def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True)->float:
+# Constants part 4 and 5
+k=0.0                                               #damping constant
+phi=0.66667                                         #initial phase
+A=0.0                                               #Amplitude
+g=1                                                 #gravity
+L=1                                                 #Length of the pendulum
+
+
+def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True,
+                 k:float=k, A:float=A, phi:float=phi, g:float=g, L:float=L)->float:
     """
     Function to return solved equation of moition for a pendulum
 
@@ -16,6 +24,11 @@ def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True)->fl
         omega: value for angular velocity (d_theta/time_step)
         time: value for time
         sin_approx: bool to indicate whether to use sin theta approximation or not
+        k: damping constant
+        A: amplitude of the driving force
+        phi: frequency of the driving force
+        g: gravity
+        L: length of the pendulum
 
     Return:
         motion: Value for equation of motion at current time 
@@ -35,7 +48,8 @@ def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True)->fl
 
 
 def pen_lin_eqn(theta:float, omega:float, 
-                total_time:int=1000, time_step:float=0.01):
+                total_time:int=1000, time_step:float=0.01, plot:bool=True,
+                k:float=k, A:float=A, phi:float=phi, g:float=g, L:float=L)->tuple[list, list, list]:
     """
     Evolving the pendulum equation in a linear case
 
@@ -44,8 +58,18 @@ def pen_lin_eqn(theta:float, omega:float,
         omega: intial angular velocity 
         total_time: total number of steps to be used
         time_step: value for incrementing time value
+        plot: bool to indicate whether to plot the results
+        k: damping constant
+        A: amplitude of the driving force
+        phi: frequency of the driving force
+        g: gravity
+        L: length of the pendulum
+
+    Return:
+        Lists of time, theta and omega values
     """
 
+    params = dict(k=k, A=A, phi=phi, g=g, L=L)
     t = 0.0
     theta_lst = [theta]
     omega_lst = [omega]
@@ -54,9 +78,9 @@ def pen_lin_eqn(theta:float, omega:float,
     #implement Trapezoidal Rule
     for i in range(1, total_time):
         k1a=time_step*omega                                                                
-        k1b=time_step*eqn_pendulum(theta, omega, t)
+        k1b=time_step*eqn_pendulum(theta, omega, t, **params)
         k2a=time_step*(omega+k1b)
-        k2b=time_step*eqn_pendulum(theta+k1a, omega+k1b, t+time_step)                                                     #calculating the value for equation (21) and updating the value of theta
+        k2b=time_step*eqn_pendulum(theta+k1a, omega+k1b, t+time_step, **params)                                                     #calculating the value for equation (21) and updating the value of theta
         
         theta=theta+(k1a+k2a)/2                                                     #calculating the value for equation (21) and updating the value of theta
         omega=omega+(k1b+k2b)/2                                                     #caluclating the value for equation (22) and updating the value of omega
@@ -66,6 +90,11 @@ def pen_lin_eqn(theta:float, omega:float,
         omega_lst.append(omega)                                                    #appending the updated value of omega
         time_lst.append(t)                                                         #appending the updated value of t(time)
 
+    if not plot:
+        return time_lst, theta_lst, omega_lst
+
+    import matplotlib.pyplot as plt
+
     plt.plot(time_lst, omega_lst, "blue", label=r"Angular Velocity, $\omega$")
     plt.plot(time_lst, theta_lst, "red", label=r"Theta $\theta$")
     plt.title(r"Solving Linear Pendulumn Equation with initial conditions $\theta$ = {:.2f} radians | $\omega$ = {:.2f} rad/s".format(theta_lst[0], omega_lst[0]),
@@ -76,9 +105,12 @@ def pen_lin_eqn(theta:float, omega:float,
     plt.grid()
     plt.show()
 
+    return time_lst, theta_lst, omega_lst
+
 
 def pen_non_lin_eqn(theta:float, omega:float, 
-                total_time:int=1000, time_step:float=0.01):
+                total_time:int=1000, time_step:float=0.01, plot:bool=True,
+                k:float=k, A:float=A, phi:float=phi, g:float=g, L:float=L)->tuple[list, list, list]:
     """
     Evolving the pendulum equation in a non-linear case
 
@@ -87,8 +119,18 @@ def pen_non_lin_eqn(theta:float, omega:float,
         omega: intial angular velocity 
         total_time: total number of steps to be used
         time_step: value for incrementing time value
+        plot: bool to indicate whether to plot the results
+        k: damping constant
+        A: amplitude of the driving force
+        phi: frequency of the driving force
+        g: gravity
+        L: length of the pendulum
+
+    Return:
+        Lists of time, theta and omega values
     """
 
+    params = dict(k=k, A=A, phi=phi, g=g, L=L)
     t = 0.0
     theta_lst = [theta]
     omega_lst = [omega]
@@ -97,9 +139,9 @@ def pen_non_lin_eqn(theta:float, omega:float,
     #implement Trapezoidal Rule
     for i in range(1, total_time):
         k1a=time_step*omega                                                                
-        k1b=time_step*eqn_pendulum(theta, omega, t, sin_approx=False)
+        k1b=time_step*eqn_pendulum(theta, omega, t, sin_approx=False, **params)
         k2a=time_step*(omega+k1b)
-        k2b=time_step*eqn_pendulum(theta+k1a, omega+k1b, t+time_step, sin_approx=False)                                                     #calculating the value for equation (21) and updating the value of theta
+        k2b=time_step*eqn_pendulum(theta+k1a, omega+k1b, t+time_step, sin_approx=False, **params)                                                     #calculating the value for equation (21) and updating the value of theta
         
         theta=theta+(k1a+k2a)/2                                                     #calculating the value for equation (21) and updating the value of theta
         omega=omega+(k1b+k2b)/2                                                     #caluclating the value for equation (22) and updating the value of omega
@@ -109,6 +151,11 @@ def pen_non_lin_eqn(theta:float, omega:float,
         omega_lst.append(omega)                                                    #appending the updated value of omega
         time_lst.append(t)                                                         #appending the updated value of t(time)
 
+    if not plot:
+        return time_lst, theta_lst, omega_lst
+
+    import matplotlib.pyplot as plt
+
     plt.plot(time_lst, omega_lst, "blue", label=r"Angular Velocity, $\omega$")
     plt.plot(time_lst, theta_lst, "red", label=r"Theta $\theta$")
     plt.title(r"Solving Non-Linear Pendulumn Equation with initial conditions $\theta$ = {:.2f} radians | $\omega$ = {:.2f} rad/s".format(theta_lst[0], omega_lst[0]),
@@ -119,13 +166,7 @@ def pen_non_lin_eqn(theta:float, omega:float,
     plt.grid()
     plt.show()
 
-
-# Constants part 4 and 5
-k=0.0                                               #damping constant
-phi=0.66667                                         #initial phase
-A=0.0                                               #Amplitude
-g=1                                                 #gravity
-L=1                                                 #Length of the pendulum
+    return time_lst, theta_lst, omega_lst
 
 
 if __name__=="__main__":
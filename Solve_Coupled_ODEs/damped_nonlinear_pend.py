@@ -4,7 +4,6 @@ numerical integration of a damped nonlinear pendulum
 """
 
 import math 
-import matplotlib.pyplot as plt
 
 
 def eqn_pendulum(theta:float, omega:float, time:float, sin_approx:bool=True)->float:
@@ -41,6 +40,8 @@ g=1
 L=1                                                                             #Length of the pendulum
 
 if __name__=="__main__":
+    import matplotlib.pyplot as plt
+
     theta=3.0                                                                       #value of theta
     omega=0.0                                                                       #angular velocity
     t=0.0                                                                           #time
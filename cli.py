@@ -0,0 +1,196 @@
+"""
+Single entry point for the scripts in this repository
+
+Each subcommand imports the module it needs (and its heavy dependencies
+like matplotlib, numpy or tqdm) only when it runs, so cold starts stay
+cheap. Run from the repository root, eg.
+
+    python cli.py convert /videos --profile-imports
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import importlib
+import pathlib
+import sys
+
+_IMPORT_TIMES = []
+
+
+def _load(name:str):
+    """
+    Function to import a module lazily, recording how long it took
+
+    Args:
+        name: dotted module name relative to the repository root
+
+    Returns:
+        The imported module
+    """
+    before = time.perf_counter()
+    module = importlib.import_module(name)
+    _IMPORT_TIMES.append((name, (time.perf_counter() - before) * 1000))
+    return module
+
+
+def _video_files(input_dir:pathlib.Path, extensions:list)->list:
+    return sorted(p for p in input_dir.iterdir() if p.suffix.lower() in extensions)
+
+
+def cmd_probe(args):
+    check_av1 = _load("check_av1")
+    extensions = args.ext or _load("convert_av1_h264").VIDEO_EXTENSIONS
+    error = check_av1.get_video_codec_ffprobe(_video_files(args.input_dir, extensions))
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_convert(args):
+    converter = _load("convert_av1_h264")
+    converter.convert_directory(args.input_dir, args.output_dir)
+    return 0
+
+
+def cmd_integrate(args):
+    if args.method == "trapezoid":
+        module = _load("Solve_Coupled_ODEs.Trap_Rule")
+    else:
+        module = _load("Solve_Coupled_ODEs.Runge_Kutta")
+
+    params = dict(k=args.damping, A=args.amplitude, phi=args.phi, g=args.gravity, L=args.length)
+
+    if args.method == "trapezoid":
+        evolve = module.pen_lin_eqn if args.linear else module.pen_non_lin_eqn
+        t_list, theta_list, omega_list = evolve(args.theta, args.omega, args.steps,
+                                                args.dt, plot=not args.no_plot, **params)
+    else:
+        t_list, theta_list, omega_list = module.evolve_pendulum(
+            args.theta, args.omega, args.steps, args.dt, sin_approx=args.linear, **params)
+        if not args.no_plot:
+            module.plot_pendulum(t_list, theta_list, omega_list,
+                                 "Solving Pendulumn Equation with initial conditions")
+
+    print(f"t = {t_list[-1]:.4f} s | theta = {theta_list[-1]:.6f} rad | omega = {omega_list[-1]:.6f} rad/s")
+    return 0
+
+
+def cmd_solve(args):
+    module = _load("Numerical_Methods_NR_Bisection.func_min_NR_bis")
+    c_1, c_2, c_3 = args.coeffs
+
+    if args.method == "bisection":
+        if args.x1 is None or args.x2 is None:
+            print("bisection needs --x1 and --x2", file=sys.stderr)
+            return 2
+        if module.eval_func(c_1, c_2, c_3, args.x1) > 0 or module.eval_func(c_1, c_2, c_3, args.x2) < 0:
+            print("need f(x1) < 0 and f(x2) > 0", file=sys.stderr)
+            return 2
+        module.bisection_method(c_1, c_2, c_3, args.x1, args.x2, plot=not args.no_plot)
+    else:
+        module.NR_method(c_1, c_2, c_3, args.x0, plot=not args.no_plot)
+    return 0
+
+
+def cmd_dedup(args):
+    module = _load("HackerRank.string_print")
+    module.merge_the_tools_file(args.input, args.output, args.k, workers=args.workers)
+    return 0
+
+
+def cmd_topk(args):
+    module = _load("HackerRank.top_K_freq_ele")
+    source = open(args.input) if args.input != "-" else sys.stdin
+    try:
+        nums = (int(tok) for line in source for tok in line.split())
+        if args.approx:
+            sketch = module.SpaceSaving(args.approx)
+            sketch.extend(nums)
+            for item, count, error in sketch.top(args.k):
+                print(item, count, error)
+        else:
+            for item in module.Solution().topKFrequent(list(nums), args.k):
+                print(item)
+    finally:
+        if source is not sys.stdin:                             # only close files opened here
+            source.close()
+    return 0
+
+
+def build_parser()->argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description=__doc__.splitlines()[1])
+    parser.add_argument("--profile-imports", action="store_true",
+                        help="report startup and per-module import times on stderr")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("probe", help="list videos whose codec is not h264")
+    p.add_argument("input_dir", type=pathlib.Path)
+    p.add_argument("--ext", nargs="+", help="file extensions to check, defaults to those convert handles")
+    p.set_defaults(func=cmd_probe)
+
+    p = sub.add_parser("convert", help="remux/transcode videos to h264 .mp4")
+    p.add_argument("input_dir", type=pathlib.Path)
+    p.add_argument("-o", "--output-dir", type=pathlib.Path,
+                   help="defaults to INPUT_DIR/converted")
+    p.set_defaults(func=cmd_convert)
+
+    p = sub.add_parser("integrate", help="evolve the (damped, driven) pendulum equation")
+    p.add_argument("method", choices=["trapezoid", "rk4"])
+    p.add_argument("--theta", type=float, default=3.0, help="initial angle (rad)")
+    p.add_argument("--omega", type=float, default=0.0, help="initial angular velocity (rad/s)")
+    p.add_argument("--steps", type=int, default=1000)
+    p.add_argument("--dt", type=float, default=0.01)
+    p.add_argument("--damping", type=float, default=0.0)
+    p.add_argument("--amplitude", type=float, default=0.0, help="driving force amplitude")
+    p.add_argument("--phi", type=float, default=0.6667, help="driving frequency")
+    p.add_argument("--gravity", type=float, default=1.0)
+    p.add_argument("--length", type=float, default=1.0)
+    p.add_argument("--linear", action="store_true", help="use the small angle approximation")
+    p.add_argument("--no-plot", action="store_true")
+    p.set_defaults(func=cmd_integrate)
+
+    p = sub.add_parser("solve", help="find a root of c1*x^2 + c2*x + c3")
+    p.add_argument("method", choices=["bisection", "newton"])
+    p.add_argument("--coeffs", type=float, nargs=3, default=[1, -4, -5], metavar=("C1", "C2", "C3"))
+    p.add_argument("--x1", type=float, help="bisection lower bound, f(x1) < 0")
+    p.add_argument("--x2", type=float, help="bisection upper bound, f(x2) > 0")
+    p.add_argument("--x0", type=float, default=-5, help="Newton-Raphson initial guess")
+    p.add_argument("--no-plot", action="store_true")
+    p.set_defaults(func=cmd_solve)
+
+    p = sub.add_parser("dedup", help="merge_the_tools over a large file")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("-k", type=int, required=True)
+    p.add_argument("--workers", type=int, default=1)
+    p.set_defaults(func=cmd_dedup)
+
+    p = sub.add_parser("topk", help="most frequent integers in a whitespace separated file")
+    p.add_argument("input", help="file path, or - for stdin")
+    p.add_argument("-k", type=int, default=10)
+    p.add_argument("--approx", type=int, metavar="COUNTERS",
+                   help="stream with a fixed-size Space-Saving sketch")
+    p.set_defaults(func=cmd_topk)
+
+    return parser
+
+
+def main(argv:list=None)->int:
+    args = build_parser().parse_args(argv)
+    startup = (time.perf_counter() - _START) * 1000
+
+    status = args.func(args)
+
+    if args.profile_imports:
+        print(f"startup: {startup:.1f} ms", file=sys.stderr)
+        for name, elapsed in _IMPORT_TIMES:
+            print(f"import {name}: {elapsed:.1f} ms", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
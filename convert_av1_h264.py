@@ -2,71 +2,131 @@ import pathlib
 import subprocess
 import json
 import re
-from tqdm import tqdm
+from collections import Counter
 
-def get_video_codec(file_path:pathlib.Path)->tuple[str, None]:
+VIDEO_EXTENSIONS = (".mp4", ".m4v", ".mkv", ".mov", ".webm", ".avi")
+MP4_AUDIO_CODECS = {"aac", "mp3", "ac3", "eac3", "alac"}                      # audio codecs that can be copied into .mp4
+
+def get_stream_info(file_path:pathlib.Path)->dict:
     """
-    Function for retrieving video codec
+    Function for retrieving video codec, audio codecs and duration
+    with a single ffprobe call
 
     Args:
         file_path: Path to video file
 
     Returns:
-        Video codec if found, else return None
+        Dict with keys 'video' (codec or None), 'audio' (list of codecs)
+        and 'duration' (seconds or None), None if probing failed
     """
 
     command = [
         'ffprobe',
         '-v', 'error',
-        '-select_streams', 'v:0',
-        '-show_entries', 'stream=codec_name',
+        '-show_entries', 'stream=codec_type,codec_name:format=duration',
         '-of', 'json',
         str(file_path)]
-    
+
     try:
         result = subprocess.run(command, capture_output=True, text=True, check=True)
         data = json.loads(result.stdout)
-        if 'streams' in data and len(data['streams']) > 0:
-            return data['streams'][0]['codec_name']
-        
     except Exception as e:
-        print(f"Error checking codec: {e}")
+        print(f"Error probing streams: {e}")
+        return None
 
-    return None
+    streams = data.get('streams', [])
+    video = [s.get('codec_name') for s in streams if s.get('codec_type') == 'video']
+    audio = [s.get('codec_name') for s in streams if s.get('codec_type') == 'audio']
 
-def get_video_duration(file_path):
-    command = [
-        'ffprobe',
-        '-v', 'error',
-        '-show_entries', 'format=duration',
-        '-of', 'default=noprint_wrappers=1:nokey=1',
-        str(file_path)
-    ]
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        return float(result.stdout.strip())
-    except Exception as e:
-        print(f"Error getting duration: {e}")
-    return None
+        duration = float(data['format']['duration'])
+    except (KeyError, TypeError, ValueError):
+        duration = None
 
-def convert_to_h264_nvenc(input_path:pathlib.Path, output_path:pathlib.Path):
-    total_duration = get_video_duration(input_path)
-    if not total_duration:
-        print(f"Skipping {input_path.name} due to missing duration info.")
-        return
+    return {'video': video[0] if video else None, 'audio': audio, 'duration': duration}
+
+def plan_conversion(file_path:pathlib.Path, info:dict)->str:
+    """
+    Function to decide what needs to be done to get an .mp4 with h264 video
+
+    Args:
+        file_path: Path to video file
+        info: Stream info as returned by get_stream_info
+
+    Returns:
+        'novideo' if there is no video stream, 'skip' if nothing needs to
+        change, 'remux' if only the container changes, 'audio' if some
+        audio streams need transcoding, else 'video'
+    """
+
+    if info['video'] is None:
+        return "novideo"
+
+    if info['video'] != "h264":
+        return "video"
+
+    if any(codec not in MP4_AUDIO_CODECS for codec in info['audio']):
+        return "audio"
+
+    if file_path.suffix.lower() != ".mp4":
+        return "remux"
+
+    return "skip"
+
+def build_ffmpeg_command(input_path:pathlib.Path, output_path:pathlib.Path,
+                         action:str, audio_codecs:list=())->list:
+    """
+    Function to build the ffmpeg command for a planned conversion
+
+    Args:
+        input_path: Path to input video file
+        output_path: Path to output .mp4 file
+        action: One of 'remux', 'audio' or 'video' (see plan_conversion)
+        audio_codecs: Codecs of the audio streams in the input, in order
+
+    Returns:
+        ffmpeg command as a list of arguments
+    """
 
     command = [
         'ffmpeg',
         '-y',                                   # Overwrite output if it exists
         '-i', str(input_path),
-        '-c:v', 'h264_nvenc',
-        '-preset', 'p7',
-        '-rc', 'constqp',
-        '-qp', '18',
-        '-c:a', 'copy',
-        str(output_path)
+        '-map', '0:v:0',                        # first video stream
+        '-map', '0:a?',                         # all audio streams, if any
+        '-dn', '-sn',                           # drop data/subtitle streams mp4 can't hold
     ]
 
+    if action == "video":
+        command += ['-c:v', 'h264_nvenc', '-preset', 'p7', '-rc', 'constqp', '-qp', '18']
+    else:
+        command += ['-c:v', 'copy']
+
+    # decide per audio stream, only incompatible ones are transcoded
+    for i, codec in enumerate(audio_codecs):
+        if codec in MP4_AUDIO_CODECS:
+            command += [f'-c:a:{i}', 'copy']
+        else:
+            command += [f'-c:a:{i}', 'aac', f'-b:a:{i}', '192k']
+
+    command.append(str(output_path))
+    return command
+
+def run_ffmpeg(command:list, input_path:pathlib.Path, total_duration:float)->bool:
+    """
+    Function to run ffmpeg while showing a progress bar
+
+    Args:
+        command: ffmpeg command as a list of arguments
+        input_path: Path to input video file (used for the progress label)
+        total_duration: Duration of the input in seconds
+
+    Returns:
+        True if ffmpeg finished successfully, else False
+    """
+
+    from tqdm import tqdm                                        # imported lazily, only needed while encoding
+
     process = subprocess.Popen(command, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL, universal_newlines=True)
 
     pattern = re.compile(r'time=(\d+):(\d+):(\d+)\.(\d+)')
@@ -85,21 +145,95 @@ def convert_to_h264_nvenc(input_path:pathlib.Path, output_path:pathlib.Path):
     pbar.refresh()
     pbar.close()
 
-    if process.returncode == 0:
+    return process.returncode == 0
+
+def convert_video(input_path:pathlib.Path, output_path:pathlib.Path, action:str, info:dict):
+    """
+    Function to remux or transcode a video according to the planned action
+
+    Args:
+        input_path: Path to input video file
+        output_path: Path to output .mp4 file
+        action: One of 'remux', 'audio' or 'video' (see plan_conversion)
+        info: Stream info as returned by get_stream_info
+    """
+
+    total_duration = info['duration']
+    if not total_duration:
+        print(f"Skipping {input_path.name} due to missing duration info.")
+        return
+
+    command = build_ffmpeg_command(input_path, output_path, action, info['audio'])
+
+    if run_ffmpeg(command, input_path, total_duration):
         print(f"Converted: {input_path.name}")
     else:
         print(f"Failed: {input_path.name}")
 
-if __name__ == "__main__":
-    input_dir = pathlib.Path(r"Add path here")
-    output_dir = input_dir / "converted"
+def convert_to_h264_nvenc(input_path:pathlib.Path, output_path:pathlib.Path):
+    info = get_stream_info(input_path)
+    if info is None:
+        print(f"Skipping {input_path.name}, could not probe streams.")
+        return
+
+    if info['video'] is None:
+        print(f"Skipping {input_path.name}, no video stream found.")
+        return
+
+    convert_video(input_path, output_path, "video", info)
+
+def convert_directory(input_dir:pathlib.Path, output_dir:pathlib.Path=None):
+    """
+    Function to bring every video in a directory to h264 in .mp4,
+    remuxing or transcoding only what is needed
+
+    Args:
+        input_dir: Directory holding the videos
+        output_dir: Directory for converted files, defaults to input_dir/converted
+    """
+
+    output_dir = output_dir or input_dir / "converted"
     output_dir.mkdir(exist_ok=True)
 
-    for video_file in input_dir.glob("*.mp4"):
-        codec = get_video_codec(video_file)
-        if codec != "h264":
-            output_file = output_dir / video_file.name
-            print(f"Converting {video_file.name} to H.264...")
-            convert_to_h264_nvenc(video_file, output_file)
+    messages = {
+        "remux": "Remuxing {} to .mp4...",
+        "audio": "Transcoding audio of {}...",
+        "video": "Converting {} to H.264...",
+    }
+
+    video_files = sorted(p for p in input_dir.iterdir() if p.suffix.lower() in VIDEO_EXTENSIONS)
+
+    # clip.mkv and clip.mp4 would both become clip.mp4, keep the source extension in those names
+    stems = Counter(p.stem for p in video_files)
+    written = set()
+
+    for video_file in video_files:
+        info = get_stream_info(video_file)
+        if info is None:
+            print(f"Skipping {video_file.name}, could not probe streams.")
+            continue
+
+        action = plan_conversion(video_file, info)
+        if action == "novideo":
+            print(f"Skipping {video_file.name}, no video stream found.")
+            continue
+
+        if action == "skip":
+            print(f"{video_file.name} already H.264 in .mp4. Skipping.")
+            continue
+
+        if stems[video_file.stem] > 1:
+            output_file = output_dir / f"{video_file.stem}_{video_file.suffix[1:].lower()}.mp4"
         else:
-            print(f"{video_file.name} already in H.264. Skipping.")
+            output_file = output_dir / f"{video_file.stem}.mp4"
+
+        if output_file.name.lower() in written:
+            print(f"Skipping {video_file.name}, {output_file.name} was already written.")
+            continue
+        written.add(output_file.name.lower())
+
+        print(messages[action].format(video_file.name))
+        convert_video(video_file, output_file, action, info)
+
+if __name__ == "__main__":
+    convert_directory(pathlib.Path(r"Add path here"))